@@ -1,11 +1,15 @@
 from newSpice.sim.sim_runner import SimRunner
 from newSpice.editor.spice_editor import SpiceEditor
+from newSpice.raw.raw_read import RawRead
 from newSpice.simulators.ngspice_simulator import NGspiceSimulator
-from newSpice.utils.sweep_iterators import sweep_log
 
 
 def processing_data(raw_file, log_file):
     print("Handling the simulation data of %s, log file %s" % (raw_file, log_file))
+    raw = RawRead(raw_file)
+    for step in raw.get_steps():
+        # Each step of the native .step sweep corresponds to one cap value
+        print("Step %d : %d points" % (step, len(raw.get_axis(step))))
 
 
 # select spice model
@@ -19,10 +23,11 @@ netlist.add_instruction(".tran 1n 3m")
 netlist.add_instruction(".plot V(out)")
 netlist.add_instruction(".save all")
 
-# .step dec param cap 1p 10u 1
-for cap in sweep_log(1e-12, 10e-6, 10):
-    netlist.set_component_value('C1', cap)
-    LTC.run(netlist, callback=processing_data)
+# Sweep the capacitor with the simulator's native .step facility: the netlist is parsed and the
+# operating point reused inside a single ngspice process, instead of one spawn per cap value.
+netlist.set_component_value('C1', '{cap}')
+netlist.add_instruction(".step dec param cap 1p 10u 1")
+LTC.run(netlist, callback=processing_data)
 
 LTC.wait_completion()
 
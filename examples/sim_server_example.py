@@ -20,8 +20,7 @@
 # -------------------------------------------------------------------------------
 import sys
 
-import time
-import keyboard
+import signal
 import logging
 
 from newSpice.client_server.sim_server import SimServer
@@ -34,11 +33,9 @@ _logger.addHandler(logging.StreamHandler(sys.stdout))
 
 print("Starting Server")
 server = SimServer(simulator, parallel_sims=4, output_folder='./temp_server', port=9000)
-print("Server Started. Press and hold 'q' to stop")
+print("Server Started. Press Ctrl+C to stop")
 
-while server.running():
-    time.sleep(0.2)
-    # Check whether a key was pressed
-    if keyboard.is_pressed('q'):
-        server.stop_server()
-        break
+# Event-driven stop: Ctrl+C shuts the server down and join_thread() blocks until it has terminated.
+# No polling loop, no idle wakeups and no root privileges needed for keyboard hooks.
+signal.signal(signal.SIGINT, lambda signum, frame: server.stop_server())
+server.join_thread()
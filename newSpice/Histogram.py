@@ -63,10 +63,6 @@ __author__ = "Nuno Canto Brum <me@nunobrum.com>"
 __copyright__ = "Copyright 2017, Fribourg Switzerland"
 
 def main():
-    import numpy as np
-    from scipy.stats import norm
-    import matplotlib.pyplot as plt
-
     from optparse import OptionParser
 
     usage = "usage: %prog [options] LOG_FILE TRACE"
@@ -98,6 +94,15 @@ def main():
                     help="Doesn't normalize the histogram so that area of the bell curve is 1.")
     (options, args) = opts.parse_args()
 
+    # The heavy imports only happen after the argument parsing, and when writing an image file the Agg
+    # backend is selected before pyplot is imported, skipping the GUI backend initialization entirely.
+    import io
+    import numpy as np
+    import matplotlib
+    if options.imagefile is not None:
+        matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
     values = []
 
 
@@ -112,11 +117,18 @@ def main():
         else:
             TRACE = "var"
         text = clipboard.paste()
-        for line in text.split('\n'):
-            try:
-                values.append(float(line))
-            except ValueError:
-                print("Failed to convert line: '", line, "'")
+        # One C-level pass for clean numeric content; clipboard text with non-numeric lines falls
+        # back to the per-line loop that warns and skips them. (np.fromstring's text mode is
+        # deprecated and raises on any unparseable line.)
+        try:
+            values = np.loadtxt(io.StringIO(text), ndmin=1)
+        except ValueError:
+            values = []
+            for line in text.split('\n'):
+                try:
+                    values.append(float(line))
+                except ValueError:
+                    print("Failed to convert line: '", line, "'")
     elif len(args) == 0:
         opts.print_help()
         exit(-1)
@@ -145,29 +157,42 @@ def main():
             exit(-1)
 
         if (options.filters is None) or (len(options.filters) == 0):
-            for line in log:
-                #print(line)
-                vs = line.split('\t')
-                values.append(float(vs[sav_col]))
+            log.close()
+            # numpy parses the whole column in one C-level pass, instead of a per-line float() loop
+            values = np.loadtxt(logfile, delimiter='\t', skiprows=1, usecols=(sav_col,), ndmin=1)
         else:
-            for line in log:
-                vs = map(float,line.split('\t'))
-                env = dict(zip(vars,vs))
-
-                for expression in options.filters:
-                    test = eval(expression, None, env)
-                    if test == False:
-                        break
+            log.close()
+            import re
+            try:
+                import numexpr
+            except ImportError:
+                numexpr = None
+            # Load every column once and evaluate each filter as a single vectorized expression over
+            # the column arrays, instead of one eval() plus a dict build per log line.
+            data = np.loadtxt(logfile, delimiter='\t', skiprows=1, ndmin=2)
+            # Identifiers such as V(N001) or I(V1) are not valid Python names; alias every column to a
+            # sanitized name both in the environment and inside the filter strings.
+            aliases = [(name, re.sub(r'\W', '_', name)) for name in vars]
+            aliases.sort(key=lambda pair: len(pair[0]), reverse=True)  # Longest first, avoids partial hits
+            env = {alias: data[:, vars.index(name)] for name, alias in aliases}
+            mask = np.ones(data.shape[0], dtype=bool)
+            for expression in options.filters:
+                for name, alias in aliases:
+                    if name != alias:
+                        expression = expression.replace(name, alias)
+                if numexpr is not None:
+                    test = numexpr.evaluate(expression, local_dict=env)
                 else:
-                    values.append(float(env[TRACE]))
-        log.close()
+                    test = eval(expression, None, env)
+                mask &= np.asarray(test, dtype=bool)
+            values = data[mask, sav_col]
 
     if len(values) == 0:
         print("No elements found")
     elif len(values) < options.nbins:
         print("Not enough elements for an histogram")
     else:
-        x = np.array(values, dtype=float)
+        x = np.asarray(values, dtype=float)  # No copy when values is already an ndarray
         mu = x.mean()
         mn = x.min()
         mx = x.max()
@@ -205,12 +230,14 @@ def main():
         print("Mean is " + fmt % mu)
         print("Standard Deviation is " + fmt % sd)
         print(("Sigma %d boundaries are " + fmt + " and " + fmt) % (options.sigma, sigmin, sigmax))
-        n, bins, patches = plt.hist(x, options.nbins, density=options.normalized, facecolor='green', alpha=0.75,
-                                    range=(axisXmin, axisXmax))
+        # Histogram computed once with numpy; plt.hist would traverse the data a second time internally.
+        n, bins = np.histogram(x, bins=options.nbins, range=(axisXmin, axisXmax), density=options.normalized)
+        plt.bar(bins[:-1], n, width=np.diff(bins), align='edge', facecolor='green', alpha=0.75)
         axisYmax = n.max() * 1.1
 
         if options.normalized:
-            # add a 'best fit' line
+            from scipy.stats import norm  # scipy is only needed (and only imported) for the fit line
+            # add a 'best fit' line, reusing the bin edges as abscissas
             y = norm.pdf(bins, mu, sd)
             l = plt.plot(bins, y, 'r--', linewidth=1)
             plt.axvspan(mu - options.sigma*sd, mu + options.sigma*sd, alpha=0.2, color="cyan")
@@ -231,4 +258,7 @@ def main():
             plt.savefig(options.imagefile)
         else:
             plt.show()
-main()
+
+
+if __name__ == "__main__":
+    main()
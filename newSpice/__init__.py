@@ -9,6 +9,30 @@ from .sim.sim_runner import SimRunner
 from .simulators import LTspice, NGspice, Qspice, Xyce
 
 
+import logging
+
+_LOGGER_NAMES = (
+    "newSpice.RunTask",
+    "newSpice.LTSteps",
+    "newSpice.SimClient",
+    "newSpice.SimServer",
+    "newSpice.ServerSimRunner",
+    "newSpice.RawRead",
+    "newSpice.LTSpiceSimulator",
+    "newSpice.NGSpiceSimulator",
+    "newSpice.QspiceSimulator",
+    "newSpice.SimRunner",
+    "newSpice.SimStepper",
+    "newSpice.SpiceEditor",
+    "newSpice.XYCESimulator",
+    "newSpice.SimBatch",
+    "newSpice.AscEditor",
+)
+# Logger objects are resolved once at import time; getLogger is idempotent but there is no point in
+# looking each of them up again on every set_log_level/add_log_handler call.
+_LOGGERS = tuple(logging.getLogger(name) for name in _LOGGER_NAMES)
+
+
 def all_loggers():
     """
     Returns all the name strings used as logger identifiers.
@@ -16,24 +40,7 @@ def all_loggers():
     :return: A List of strings which contains all the logger's names used in this library.
     :rtype: list[str]
     """
-    return [
-        "newSpice.RunTask",
-        "newSpice.LTSteps",
-        "newSpice.SimClient",
-        "newSpice.SimServer",
-        "newSpice.ServerSimRunner",
-        "newSpice.LTSteps",
-        "newSpice.RawRead",
-        "newSpice.LTSpiceSimulator",
-        "newSpice.NGSpiceSimulator",
-        "newSpice.QspiceSimulator",
-        "newSpice.SimRunner",
-        "newSpice.SimStepper",
-        "newSpice.SpiceEditor",
-        "newSpice.XYCESimulator",
-        "newSpice.SimBatch",
-        "newSpice.AscEditor",
-    ]
+    return list(_LOGGER_NAMES)
 
 
 def set_log_level(level):
@@ -43,9 +50,8 @@ def set_log_level(level):
     :param level: The logging level to be used, eg. logging.ERROR, logging.DEBUG, etc.
     :type level: int
     """
-    import logging
-    for logger in all_loggers():
-        logging.getLogger(logger).setLevel(level)
+    for logger in _LOGGERS:
+        logger.setLevel(level)
 
 
 def add_log_handler(handler):
@@ -55,6 +61,5 @@ def add_log_handler(handler):
     :param handler: The logging handler to be used, eg. logging.NullHandler
     :type handler: Handler
     """
-    import logging
-    for logger in all_loggers():
-        logging.getLogger(logger).addHandler(handler)
+    for logger in _LOGGERS:
+        logger.addHandler(handler)
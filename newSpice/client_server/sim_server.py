@@ -92,7 +92,7 @@ class SimServer():
         ret = []
         for task_info in self.simulation_manager.completed_tasks:
             _logger.debug(task_info)
-            runno = task_info['runno']
+            runno = task_info.runno
             if runno in self.sessions[session_id]:
                 ret.append(runno)  # transfers the dictionary from the simulation_manager completed task
                 # to the return dictionary 
@@ -103,9 +103,9 @@ class SimServer():
         if runno in self.sessions[session_id]:
 
             for task_info in self.simulation_manager.completed_tasks:
-                if runno == task_info['runno']:
+                if runno == task_info.runno:
                     # Create a buffer to store the zip file in memory
-                    zip_file = task_info['zipfile']
+                    zip_file = task_info.zipfile
                     zip = zip_file.open('rb')
                     # Read the zip file from the buffer and send it to the server
                     zip_data = zip.read()
@@ -132,3 +132,8 @@ class SimServer():
     def running(self):
         return self.simulation_manager.running()
 
+    def join_thread(self, timeout=None):
+        """Blocks the calling thread until the server thread terminates, i.e. until stop_server() is
+        called. This is the idle-free alternative to polling running() on a sleep loop."""
+        self.server_thread.join(timeout)
+
@@ -20,8 +20,8 @@ from pathlib import Path
 from typing import Union, Tuple, List
 import re
 import logging
-from .base_editor import BaseEditor, format_eng, ComponentNotFoundError, ParameterNotFoundError, PARAM_REGEX, \
-    UNIQUE_SIMULATION_DOT_INSTRUCTIONS
+from .base_editor import BaseEditor, format_eng, ComponentNotFoundError, ParameterNotFoundError, param_regex, \
+    PARAM_REPLACE_GROUP, UNIQUE_SIMULATION_DOT_INSTRUCTIONS
 
 _logger = logging.getLogger("newSpice.AscEditor")
 
@@ -109,16 +109,16 @@ class AscEditor(BaseEditor):
             return -1, None
 
     def get_parameter(self, param: str) -> str:
-        param_regex = re.compile(PARAM_REGEX % param, re.IGNORECASE)
-        line_no, match = self._get_line_matching(".PARAM", param_regex)
+        regx = param_regex(param)
+        line_no, match = self._get_line_matching(".PARAM", regx)
         if match:
             return match.group('value')
         else:
             raise ParameterNotFoundError(f"Parameter {param} not found in ASC file")
 
     def set_parameter(self, param: str, value: Union[str, int, float]) -> None:
-        param_regex = re.compile(PARAM_REGEX % param, re.IGNORECASE)
-        line_no, match = self._get_line_matching(".PARAM", param_regex)
+        regx = param_regex(param)
+        line_no, match = self._get_line_matching(".PARAM", regx)
         if match:
             _logger.debug(f"Parameter {param} found in ASC file, updating it")
             if isinstance(value, (int, float)):
@@ -126,8 +126,8 @@ class AscEditor(BaseEditor):
             else:
                 value_str = value
             line: str = self._asc_file_lines[line_no]
-            match = param_regex.search(line)  # repeating the search, so we update the correct start/stop parameter
-            start, stop = match.span(param_regex.groupindex['replace'])
+            match = regx.search(line)  # repeating the search, so we update the correct start/stop parameter
+            start, stop = match.span(PARAM_REPLACE_GROUP)
             self._asc_file_lines[line_no] = line[:start] + "{}={}".format(param, value_str) + line[stop:]
             _logger.info(f"Parameter {param} updated to {value_str}")
             _logger.debug(f"Line:{line_no + 1} Updated to: {self._asc_file_lines[line_no]}")
@@ -18,6 +18,8 @@
 # Licence:     refer to the LICENSE file
 # -------------------------------------------------------------------------------
 
+import functools
+import re
 from abc import ABC, abstractmethod
 from math import floor, log
 from pathlib import Path
@@ -57,6 +59,27 @@ SPICE_DOT_INSTRUCTIONS = (
 
 )
 PARAM_REGEX = r"(?<= )(?P<replace>%s(\s*=\s*)(?P<value>[\w\*\/\.\+\-\/\*\{\}\(\)\t ]*))(?<!\s)($|\s+)(?!\s*=)"
+# The position of the 'replace' group is fixed by the PARAM_REGEX skeleton, so it is resolved once
+# here. match.span(PARAM_REPLACE_GROUP) then skips the string-keyed groupindex lookup on every
+# set_parameter call.
+PARAM_REPLACE_GROUP = re.compile(PARAM_REGEX % 'x', re.IGNORECASE).groupindex['replace']
+
+
+@functools.lru_cache(maxsize=512)
+def param_regex(param: str) -> re.Pattern:
+    """
+    Returns the compiled regular expression matching the assignment of the given parameter.
+
+    The compiled patterns are cached: parameter sweeps ask for the same few names over and over, and
+    re.compile on a fresh format-string result bypasses the small cache inside the re module. The
+    parameter name is escaped so that regex meta characters cannot leak into the pattern.
+
+    :param param: Spice Parameter name
+    :type param: str
+    :return: Compiled regular expression with the 'replace' and 'value' groups
+    :rtype: re.Pattern
+    """
+    return re.compile(PARAM_REGEX % re.escape(param), re.IGNORECASE)
 
 
 def format_eng(value) -> str:
@@ -16,13 +16,19 @@
 #
 # Licence:     refer to the LICENSE file
 # -------------------------------------------------------------------------------
+import bisect
+import functools
+import itertools
 import os
+import sys
+import weakref
+from collections.abc import MutableSequence
 from pathlib import Path
 import re
 import logging
 
-from .base_editor import BaseEditor, format_eng, ComponentNotFoundError, ParameterNotFoundError, PARAM_REGEX, \
-    UNIQUE_SIMULATION_DOT_INSTRUCTIONS
+from .base_editor import BaseEditor, format_eng, ComponentNotFoundError, ParameterNotFoundError, param_regex, \
+    PARAM_REPLACE_GROUP, UNIQUE_SIMULATION_DOT_INSTRUCTIONS
 
 _logger = logging.getLogger("newSpice.SpiceEditor")
 from typing import Union, List, Callable, Any, Tuple
@@ -73,8 +79,10 @@ REPLACE_REGXES = {
     # This implementation replaces everything after the 2 first nets
     'W': r"^(?P<designator>W§?\w+)(?P<nodes>(\s+\S+){2})\s+(?P<value>.*)$",  # Current Controlled Switch
     # This implementation replaces everything after the 2 first nets
-    'X': r"^(?P<designator>X§?\w+)(?P<nodes>(\s+\S+){1,99}?)\s+(?P<value>\w+)(\s+params:)?(?P<params>(\s+\w+\s*=\s*[\d\w\{\}\(\)\-\+\*/]+)*)\s*\\?$",
-    # Sub-circuit, Parameter substitution not supported
+    'X': r"^(?P<designator>X§?\w+)(?P<nodes>(?:\s+\S+){1,99})\s+(?P<value>\w+)(?:\s+params:)?(?P<params>(?:\s+\w+\s*=\s*[\d\w\{\}\(\)\-\+\*/]+)*)\s*\\?$",
+    # Sub-circuit, Parameter substitution not supported. The node list is matched greedily and with
+    # non-capturing groups: the engine consumes all tokens once and gives back only what the
+    # sub-circuit name and params need, instead of retrying the lazy quantifier from the start.
     'Z': r"^(?P<designator>Z§?\w+)(?P<nodes>(\s+\S+){3})\s+(?P<value>\w+).*$",
     # MESFET and IBGT. TODO: Parameters substitution not supported
     '@': r"^(?P<designator>@§?\d+)(?P<nodes>(\s+\S+){2})\s?(?P<params>(.*)*)$",
@@ -84,39 +92,155 @@ REPLACE_REGXES = {
 
 SUBCKT_CLAUSE_FIND = r"^.SUBCKT\s+"
 
+try:
+    # Optional dependency: Google RE2 (pip install google-re2) matches in guaranteed linear time and
+    # is noticeably faster on the bulk scans over large netlists. Patterns RE2 cannot take, such as
+    # the conditional group references used by the C/R/L entries, stay on the standard re module.
+    import re2 as _re2
+except ImportError:
+    _re2 = None
+
+
+def _compile_replace_regex(pattern: str) -> 're.Pattern':
+    if _re2 is not None:
+        try:
+            return _re2.compile(pattern, re.IGNORECASE)
+        except Exception:
+            pass  # Unsupported syntax for RE2, fall back to re
+    # SPICE designators and node names are ASCII by syntax, so the ASCII flag lets the engine use
+    # plain 256-entry tables for \w/\s and case folding instead of the Unicode property tables.
+    return re.compile(pattern, re.IGNORECASE | re.ASCII)
+
+
 # Code Optimization objects, avoiding repeated compilation of regular expressions
-component_replace_regexs = {prefix: re.compile(pattern, re.IGNORECASE) for prefix, pattern in REPLACE_REGXES.items()}
-subckt_regex = re.compile(r"^.SUBCKT\s+(?P<name>\w+)", re.IGNORECASE)
-lib_inc_regex = re.compile(r"^\.(LIB|INC)\s+(.*)$", re.IGNORECASE)
+component_replace_regexs = {prefix: _compile_replace_regex(pattern) for prefix, pattern in REPLACE_REGXES.items()}
+subckt_regex = re.compile(r"^.SUBCKT\s+(?P<name>\w+)", re.IGNORECASE | re.ASCII)
+lib_inc_regex = re.compile(r"^\.(LIB|INC)\s+(.*)$", re.IGNORECASE | re.ASCII)
+
+# Tokenization of the netlist lines is done in a single C-level regex match instead of a Python loop
+# over each character. The first group is the leading character of the command, the second one the
+# remainder of the token (only relevant for the dot directives).
+_line_cmd_regex = re.compile(r"[ \t]*([^ \t])([^ \t\r\n]*)")
+
+# Classification table for the first character of a line: a single array load replaces the dict and
+# string membership tests that used to run on every parsed line.
+_CLASS_COMPONENT = 1
+_CLASS_PLUS = 2
+_CLASS_COMMENT = 3
+_CLASS_DOT = 4
+_char_class = bytearray(256)
+for _ch in REPLACE_REGXES:
+    _char_class[ord(_ch)] = _CLASS_COMPONENT
+    _char_class[ord(_ch.lower())] = _CLASS_COMPONENT
+_char_class[ord('+')] = _CLASS_PLUS
+for _ch in "#;*\n\r":
+    _char_class[ord(_ch)] = _CLASS_COMMENT
+_char_class[ord('.')] = _CLASS_DOT
+del _ch
+
+# Directive tokens as they appear on the netlist, mapped to the interned upper-cased command. A
+# netlist uses the same few spellings of .SUBCKT/.PARAM/.ENDS throughout, so after the first line
+# the '.'+upper() allocation is skipped and the equality tests downstream compare interned strings.
+_directive_cache = {}
 
 LibSearchPaths = []
 
 
+@functools.lru_cache(maxsize=32)
+def _dir_listing(directory: str) -> frozenset:
+    """Internal function. Do not use.
+    Returns the cached set of names inside a directory. Resolving sub-circuits in a hierarchical
+    design probes the same few library directories over and over; one listdir per directory replaces
+    a stat syscall per candidate file."""
+    try:
+        return frozenset(os.listdir(directory or '.'))
+    except OSError:
+        return frozenset()
+
+
+@functools.lru_cache(maxsize=512)
+def _split_component_path(component: str) -> tuple:
+    """Internal function. Do not use.
+    Splits a hierarchical component reference such as 'XU1:XDUT:R1' into the sub-circuit path, the
+    leaf designator and the suffix used when renaming a cloned sub-circuit. Sweeps hit the same
+    few references over and over, so the split work is cached."""
+    parts = component.split(SUBCKT_DIVIDER)
+    return SUBCKT_DIVIDER.join(parts[:-1]), parts[-1], '_'.join(parts[:-1])
+
+
+def _lib_file_exists(filename: str) -> bool:
+    """Internal function. Do not use.
+    Existence test against the cached directory listing."""
+    directory, name = os.path.split(filename)
+    return name in _dir_listing(directory)
+
+
+# Bytes version of subckt_regex used to scan library files without decoding them first
+_subckt_scan_regex = re.compile(rb"^.SUBCKT\s+(?P<name>\w+)", re.IGNORECASE | re.MULTILINE | re.ASCII)
+
+
+@functools.lru_cache(maxsize=16)
+def _index_library(library: str, mtime_ns: int, size: int) -> tuple:
+    """Internal function. Do not use.
+    Scans a library file once and returns its encoding, the kind of offsets stored ('b' for byte
+    positions, 't' for text-mode tell cookies) and a map of upper-cased sub-circuit names to the
+    offset of their .SUBCKT line. Repeated lookups against the same library then seek straight to
+    the definition instead of re-detecting the encoding and re-scanning the whole file. ASCII
+    compatible encodings are indexed with one multiline regex pass over the raw bytes, skipping the
+    decode of the whole file; UTF-16 needs the decoded text scan. The mtime/size signature keys the
+    cache, so an edited library gets re-indexed."""
+    encoding = detect_encoding(library)
+    index = {}
+    # detect_encoding reports UTF-16 as 'utf_16_le' (BOM-less) or 'utf-16' (from a BOM), so both
+    # spellings must route to the decoded-text scan; the byte regex below only works on
+    # ASCII-compatible encodings.
+    if not encoding.startswith(('utf_16', 'utf-16')):
+        with open(library, 'rb') as lib:
+            data = lib.read()
+        for m in _subckt_scan_regex.finditer(data):
+            name = m.group('name').decode('ascii', 'replace').upper()
+            if name not in index:
+                index[name] = m.start()
+        return encoding, 'b', index
+    with open(library, encoding=encoding) as lib:
+        offset = lib.tell()
+        line = lib.readline()
+        while line:
+            m = subckt_regex.match(line)
+            if m:
+                name = m.group('name').upper()
+                if name not in index:
+                    index[name] = offset
+            offset = lib.tell()
+            line = lib.readline()
+    return encoding, 't', index
+
+
 def get_line_command(line) -> str:
     """
     Retrives the type of SPICE command in the line.
     Starts by removing the leading spaces and the evaluates if it is a comment, a directive or a component.
     """
     if isinstance(line, str):
-        for i in range(len(line)):
-            ch = line[i]
-            if ch == ' ' or ch == '\t':
-                continue
+        m = _line_cmd_regex.match(line)
+        if m:
+            ch = m.group(1)
+            code = ord(ch)
+            cls = _char_class[code] if code < 256 else 0
+            if cls == _CLASS_COMPONENT:  # A circuit element
+                return ch.upper()
+            elif cls == _CLASS_PLUS:
+                return '+'  # This is a line continuation.
+            elif cls == _CLASS_COMMENT:  # It is a comment or a blank line
+                return "*"
+            elif cls == _CLASS_DOT:  # this is a directive
+                token = m.group(2)
+                cmd = _directive_cache.get(token)
+                if cmd is None:
+                    cmd = _directive_cache[token] = sys.intern('.' + token.upper())
+                return cmd
             else:
-                ch = ch.upper()
-                if ch in REPLACE_REGXES:  # A circuit element
-                    return ch
-                elif ch == '+':
-                    return '+'  # This is a line continuation.
-                elif ch in "#;*\n\r":  # It is a comment or a blank line
-                    return "*"
-                elif ch == '.':  # this is a directive
-                    j = i + 1
-                    while j < len(line) and (line[j] not in (' ', '\t', '\r', '\n')):
-                        j += 1
-                    return line[i:j].upper()
-                else:
-                    raise SyntaxError('Unrecognized command in line "%s"' % line)
+                raise SyntaxError('Unrecognized command in line "%s"' % line)
     elif isinstance(line, SpiceCircuit):
         return ".SUBCKT"
     else:
@@ -126,15 +250,11 @@ def get_line_command(line) -> str:
 def _first_token_upped(line):
     """
     (Private function. Not to be used directly)
-    Returns the first non-space character in the line. If a point '.' is found, then it gets the primitive associated.
+    Returns the first token of the line in upper case. str.split stays inside CPython's C string
+    code, which beats both a per-character loop and a regex match for this job.
     """
-    i = 0
-    while i < len(line) and line[i] in (' ', '\t'):
-        i += 1
-    j = i
-    while i < len(line) and not (line[i] in (' ', '\t')):
-        i += 1
-    return line[j:i].upper()
+    tokens = line.split(None, 1)
+    return tokens[0].upper() if tokens else ''
 
 
 def _is_unique_instruction(instruction):
@@ -142,6 +262,10 @@ def _is_unique_instruction(instruction):
     (Private function. Not to be used directly)
     Returns true if the instruction is one of the unique instructions
     """
+    # A line that does not start with a dot, indented or not, cannot be a directive. This settles
+    # almost every line of the scans in add_instruction without the full command parse.
+    if isinstance(instruction, str) and instruction.lstrip(' \t')[:1] != '.':
+        return False
     cmd = get_line_command(instruction)
     return cmd in UNIQUE_SIMULATION_DOT_INSTRUCTIONS
 
@@ -157,6 +281,116 @@ class MissingExpectedClauseError(Exception):
     """Missing expected clause in Spice netlist"""
 
 
+class _SharedNetlist(list):
+    """Internal class. Do not use.
+    List of netlist lines that knows which un-materialised _CowNetlist views still read through it.
+    Every mutating operation first detaches those views, so a clone remains a faithful snapshot of
+    its parent at clone() time even when the parent is edited afterwards. clone() converts the
+    parent netlist to this class the first time it is cloned."""
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self._views = []  # weak references to the _CowNetlist views reading this list
+
+    def _register(self, view: '_CowNetlist') -> None:
+        self._views.append(weakref.ref(view))
+
+    def _detach_views(self) -> None:
+        views, self._views = self._views, []
+        for ref in views:
+            view = ref()
+            if view is not None:
+                view._materialize()
+
+    def _mutator(name):
+        wrapped = getattr(list, name)
+
+        def method(self, *args):
+            self._detach_views()
+            return wrapped(self, *args)
+        method.__name__ = name
+        return method
+
+    __setitem__ = _mutator('__setitem__')
+    __delitem__ = _mutator('__delitem__')
+    __iadd__ = _mutator('__iadd__')
+    __imul__ = _mutator('__imul__')
+    append = _mutator('append')
+    extend = _mutator('extend')
+    insert = _mutator('insert')
+    remove = _mutator('remove')
+    pop = _mutator('pop')
+    clear = _mutator('clear')
+    sort = _mutator('sort')
+    reverse = _mutator('reverse')
+
+    del _mutator
+
+
+class _CowNetlist(MutableSequence):
+    """Internal class. Do not use.
+    Copy-on-write view over the netlist of a cloned sub-circuit. Reads compose the prepended header
+    lines, the parent netlist (which stays shared and untouched) and the appended footer lines, so
+    cloning is O(1). The composition materialises into a private list on the first mutation of
+    either side: a write to the view itself, or a write to the parent through _SharedNetlist, which
+    detaches all outstanding views first. Either way the copy made is exactly the one clone() used
+    to make eagerly for every clone, mutated or not."""
+
+    def __init__(self, parent, prepend=(), append=()):
+        self._parent = parent
+        self._prepend = list(prepend)
+        self._append = list(append)
+        self._own = None  # Private list, created on first mutation
+
+    def _materialize(self) -> list:
+        if self._own is None:
+            self._own = self._prepend + list(self._parent) + self._append
+            self._parent = self._prepend = self._append = None
+        return self._own
+
+    def __len__(self):
+        if self._own is not None:
+            return len(self._own)
+        return len(self._prepend) + len(self._parent) + len(self._append)
+
+    def __getitem__(self, item):
+        if self._own is not None:
+            return self._own[item]
+        if isinstance(item, slice):
+            return (self._prepend + list(self._parent) + self._append)[item]
+        length = self.__len__()
+        if item < 0:
+            item += length
+        if not 0 <= item < length:
+            raise IndexError("netlist index out of range")
+        if item < len(self._prepend):
+            return self._prepend[item]
+        item -= len(self._prepend)
+        if item < len(self._parent):
+            return self._parent[item]
+        return self._append[item - len(self._parent)]
+
+    def __iter__(self):
+        # The MutableSequence mixin iterates through __getitem__, paying the segment arithmetic per
+        # element. Chaining the three segments keeps read-mostly clones on plain list iterators,
+        # which is what write_lines/_flatten do with clones made just to run one simulation.
+        if self._own is not None:
+            return iter(self._own)
+        return itertools.chain(self._prepend, self._parent, self._append)
+
+    def __setitem__(self, item, value):
+        self._materialize()[item] = value
+
+    def __delitem__(self, item):
+        del self._materialize()[item]
+
+    def insert(self, index, value):
+        self._materialize().insert(index, value)
+
+    def copy(self) -> list:
+        return self._prepend + list(self._parent) + self._append if self._own is None else self._own.copy()
+
+
 class SpiceCircuit(BaseEditor):
     """
     The Spice Circuit represents sub-circuits within a SPICE circuit and since sub-circuits can have sub-circuits inside
@@ -172,18 +406,59 @@ class SpiceCircuit(BaseEditor):
 
     def __init__(self):
         self.netlist = []
+        self._designator_index = None  # Lazy {first token: line_no} map used by _get_line_starting_with
+        self._str_line_nos = []  # Line numbers holding plain strings, rebuilt together with the index
+        self._value_span_cache = {}  # {designator: (line_no, start, end, line)} reused between edits
+        self._cached_name = None  # Name found on the .SUBCKT clause, kept to spare repeated searches
 
-    def _get_line_starting_with(self, substr: str) -> int:
-        """Internal function. Do not use."""
-        # This function returns the line number that starts with the substr string.
-        # If the line is not found, then -1 is returned.
-        substr_upper = substr.upper()
+    def _rebuild_index(self) -> None:
+        """Internal function. Do not use.
+        Walks the netlist once and builds the designator index, together with the list of positions
+        that hold plain strings. Only the first occurrence of each token is registered, matching the
+        scan order of the previous implementation."""
+        index = {}
+        str_line_nos = []
         for line_no, line in enumerate(self.netlist):
             if isinstance(line, SpiceCircuit):  # If it is a sub-circuit it will simply ignore it.
                 continue
-            line_upcase = _first_token_upped(line)
-            if line_upcase == substr_upper:
-                return line_no
+            str_line_nos.append(line_no)
+            # Interned so that successive rebuilds share the token strings instead of keeping one
+            # upper-cased copy per rebuild alive in the keys.
+            token = sys.intern(_first_token_upped(line))
+            if token not in index:
+                index[token] = line_no
+        self._designator_index = index
+        self._str_line_nos = str_line_nos
+
+    def _pristine_copy(self) -> 'SpiceCircuit':
+        """Internal function. Do not use.
+        Returns an independent copy of this sub-circuit. Unlike clone(), no manipulation markers
+        are added, so the copy serializes exactly as the original. Used by reset_netlist to restore
+        the netlist from the in-memory snapshot without re-reading the file."""
+        dup = SpiceCircuit()
+        dup._cached_name = self._cached_name
+        dup.netlist = [line if isinstance(line, str) else line._pristine_copy()
+                       for line in self.netlist]
+        return dup
+
+    def _string_line_numbers(self) -> List[int]:
+        """Internal function. Do not use.
+        Returns the positions of the plain string lines, letting the scanning loops skip embedded
+        sub-circuit objects without one isinstance test per element. Shares the lifecycle of the
+        designator index."""
+        if self._designator_index is None:
+            self._rebuild_index()
+        return self._str_line_nos
+
+    def _get_line_starting_with(self, substr: str) -> int:
+        """Internal function. Do not use."""
+        # This function returns the line number that starts with the substr string.
+        # The lookup is done on a lazily built index, making repeated edits O(1) instead of a scan.
+        if self._designator_index is None:
+            self._rebuild_index()
+        line_no = self._designator_index.get(substr.upper())
+        if line_no is not None:
+            return line_no
         error_msg = "line starting with '%s' not found in netlist" % substr
         _logger.error(error_msg)
         raise ComponentNotFoundError(error_msg)
@@ -191,52 +466,96 @@ class SpiceCircuit(BaseEditor):
     def _add_lines(self, line_iter):
         """Internal function. Do not use.
         Add a list of lines to the netlist."""
+        self._designator_index = None
+        # Loop-invariant lookups are bound to locals: this loop runs once per line of the file and
+        # LOAD_FAST is the cheapest name access the interpreter has.
+        netlist = self.netlist
+        netlist_append = netlist.append
+        line_command = get_line_command
+        pending = None  # Chunks of an instruction spanning '+' continuation lines
         for line in line_iter:
-            cmd = get_line_command(line)
+            cmd = line_command(line)
+            if cmd == '+':
+                # Continuations are collected in a list and joined once when the instruction ends.
+                # Concatenating onto the stored string would copy the whole base string per line,
+                # O(L²) on instructions with long continuation runs.
+                assert pending is not None or len(netlist) > 0, \
+                    "ERROR: The first line cannot be starting with a +"
+                if pending is None:
+                    pending = [netlist.pop(), line]
+                else:
+                    pending.append(line)
+                continue
+            if pending is not None:
+                netlist_append(''.join(pending))
+                pending = None
             if cmd == '.SUBCKT':
                 sub_circuit = SpiceCircuit()
                 sub_circuit.netlist.append(line)
+                m = subckt_regex.search(line)
+                if m:  # The name is already at hand here, storing it spares the search in name()
+                    sub_circuit._cached_name = m.group('name')
                 # Advance to the next non nested .ENDS
                 finished = sub_circuit._add_lines(line_iter)
                 if finished:
-                    self.netlist.append(sub_circuit)
+                    netlist_append(sub_circuit)
                 else:
                     return False
-            elif cmd == '+':
-                assert len(self.netlist) > 0, "ERROR: The first line cannot be starting with a +"
-                self.netlist[-1] += line  # Appends to the last line
             else:
-                self.netlist.append(line)
+                netlist_append(line)
                 if cmd[:4] == '.END':  # True for either .END and .ENDS primitives
                     return True  # If an sub-circuit is ended correctly, returns True
+        if pending is not None:
+            netlist_append(''.join(pending))
         return False  # If a sub-circuit ends abruptly, returns False
 
     def write_lines(self, f):
         """Internal function. Do not use."""
-        # This helper function writes the contents of sub-circuit to the file f
+        # This helper function writes the contents of sub-circuit to the file f.
+        # The lines are flattened first and handed to the IO layer in a single writelines() call,
+        # instead of one f.write() per netlist line.
+        out = []
+        self._flatten(out)
+        f.writelines(out)
+
+    def _flatten(self, out: list) -> None:
+        """Internal function. Do not use.
+        Appends the fully expanded netlist lines to the out list."""
         for command in self.netlist:
             if isinstance(command, SpiceCircuit):
-                command.write_lines(f)
+                command._flatten(out)
             else:
-                f.write(command)
+                out.append(command)
+
+    def _replace_line(self, line_no: int, new_line: str) -> None:
+        """Internal function. Do not use.
+        Single point used for in-place replacement of a netlist line, so that subclasses keeping a
+        serialization cache can splice the change into it."""
+        if self._designator_index is not None:
+            # The index survives value edits; it is only dropped when the leading token changes.
+            old_line = self.netlist[line_no]
+            if not isinstance(old_line, str) or _first_token_upped(old_line) != _first_token_upped(new_line):
+                self._designator_index = None
+        self.netlist[line_no] = new_line
+
+    def _invalidate_serialization(self) -> None:
+        """Internal function. Do not use.
+        Called on structural changes of the netlist. Only the top level SpiceEditor keeps a
+        serialization cache, so here it is a no-op."""
+        ...
 
     def _get_line_matching(self, command, search_expression: re.Pattern) -> Tuple[int, Union[re.Match, None]]:
         """
         Internal function. Do not use. Returns a line starting with command and matching the search with the regular
         expression
         """
-        line_no = 0
-        while line_no < len(self.netlist):
+        for line_no in self._string_line_numbers():  # Sub-circuits are simply ignored.
             line = self.netlist[line_no]
-            if isinstance(line, SpiceCircuit):  # If it is a sub-circuit it will simply ignore it.
-                line_no += 1
-                continue
             cmd = get_line_command(line)
             if cmd == command:
                 match = search_expression.search(line)
                 if match:
                     return line_no, match
-            line_no += 1
         return -1, None  # If it fails, it returns an invalid line number and No match
 
     def _get_subckt(self, instance_name: str) -> 'SpiceCircuit':
@@ -273,18 +592,18 @@ class SpiceCircuit(BaseEditor):
         if sub_circuit is None:
             # If we reached here is because the subciruit was not found. Search for it in declared libraries
             libs_list_full_path = []
+            # TODO: This changes dependend of the simulator being used.
+            user_lib_dir = os.path.join(os.path.expanduser('~'), "Documents\\LTspiceXVII\\lib\\sub")
             for lib in libs_list:
-                if os.path.exists(lib):
+                if _lib_file_exists(lib):
                     libs_list_full_path.append(lib)
                     continue
-                # TODO: This changes dependend of the simulator being used.
-                lib_filename = os.path.join(os.path.expanduser('~'), "Documents\\LTspiceXVII\\lib\\sub", lib)
-                if os.path.exists(lib_filename):
+                if _lib_file_exists(os.path.join(user_lib_dir, lib)):
                     libs_list_full_path.append(lib)
                     continue
                 for path in LibSearchPaths:
                     lib_filename = os.path.join(path, lib)
-                    if os.path.exists(lib_filename):
+                    if _lib_file_exists(lib_filename):
                         libs_list_full_path.append(lib_filename)
                         continue
 
@@ -319,14 +638,22 @@ class SpiceCircuit(BaseEditor):
         line_no = self._get_line_starting_with(component)
 
         line = self.netlist[line_no]
-        m = regex.match(line)
-        if m is None:
-            raise UnrecognizedSyntaxError(line, REPLACE_REGXES[prefix])
-            # print("Unsupported line ""{}""".format(line))
+        # In a sweep, the same component is edited over and over and only the value changes. The
+        # value span of the line produced by the previous edit is remembered, so the regex only has
+        # to run again when the line was touched by something else (checked by identity).
+        cached = self._value_span_cache.get(component)
+        if cached is not None and cached[0] == line_no and cached[3] is line:
+            start, end = cached[1], cached[2]
         else:
+            m = regex.match(line)
+            if m is None:
+                raise UnrecognizedSyntaxError(line, REPLACE_REGXES[prefix])
+                # print("Unsupported line ""{}""".format(line))
             start = m.start('value')
             end = m.end('value')
-            self.netlist[line_no] = line[:start] + value + line[end:]
+        new_line = line[:start] + value + line[end:]
+        self._replace_line(line_no, new_line)
+        self._value_span_cache[component] = (line_no, start, start + len(value), new_line)
 
     def clone(self, **kwargs) -> 'SpiceCircuit':
         """
@@ -338,9 +665,20 @@ class SpiceCircuit(BaseEditor):
         :rtype: SpiceCircuit
         """
         clone = SpiceCircuit()
-        clone.netlist = self.netlist.copy()
-        clone.netlist.insert(0, "***** SpiceEditor Manipulated this sub-circuit ****" + END_LINE_TERM)
-        clone.netlist.append("***** ENDS SpiceEditor ****" + END_LINE_TERM)
+        clone._cached_name = self._cached_name
+        # The parent netlist is shared read-only and the header/footer lines are composed around
+        # it. A private copy is only made when either side gets modified: the view materialises
+        # itself on its first mutation, and _SharedNetlist detaches all live views before any
+        # mutation of the parent (see _CowNetlist).
+        parent = self.netlist
+        if not isinstance(parent, _SharedNetlist):
+            parent = _SharedNetlist(parent)
+            self.netlist = parent
+        view = _CowNetlist(parent,
+                           prepend=("***** SpiceEditor Manipulated this sub-circuit ****" + END_LINE_TERM,),
+                           append=("***** ENDS SpiceEditor ****" + END_LINE_TERM,))
+        parent._register(view)
+        clone.netlist = view
         new_name = kwargs.get('new_name', None)
         if new_name:  # If it is different from None
             clone.setname(new_name)
@@ -352,11 +690,14 @@ class SpiceCircuit(BaseEditor):
 
         :rtype: str
         """
+        if self._cached_name is not None:
+            return self._cached_name
         if len(self.netlist):
             for line in self.netlist:
                 m = subckt_regex.search(line)
                 if m:
-                    return m.group('name')
+                    self._cached_name = m.group('name')
+                    return self._cached_name
             else:
                 raise RuntimeError("Unable to find .SUBCKT clause in subcircuit")
         else:
@@ -382,26 +723,29 @@ class SpiceCircuit(BaseEditor):
                     # Replacing the name in the SUBCKT Clause
                     start = m.start('name')
                     end = m.end('name')
-                    self.netlist[line_no] = line[:start] + new_name + line[end:]
+                    self._replace_line(line_no, line[:start] + new_name + line[end:])
                     break
                 line_no += 1
             else:
                 raise MissingExpectedClauseError("Unable to find .SUBCKT clause in subcircuit")
+            self._cached_name = new_name
 
             # This second loop finds the .ENDS clause
             while line_no < lines:
                 line = self.netlist[line_no]
                 if get_line_command(line) == '.ENDS':
-                    self.netlist[line_no] = '.ENDS ' + new_name + END_LINE_TERM
+                    self._replace_line(line_no, '.ENDS ' + new_name + END_LINE_TERM)
                     break
                 line_no += 1
             else:
                 raise MissingExpectedClauseError("Unable to find .SUBCKT clause in subcircuit")
         else:
             # Avoiding exception by creating an empty sub-circuit
+            self._designator_index = None
             self.netlist.append("* SpiceEditor Created this sub-circuit")
             self.netlist.append('.SUBCKT %s%s' % (new_name, END_LINE_TERM))
             self.netlist.append('.ENDS %s%s' % (new_name, END_LINE_TERM))
+            self._cached_name = new_name
 
     def get_component_info(self, component) -> dict:
         """
@@ -445,7 +789,7 @@ class SpiceCircuit(BaseEditor):
         :rtype: str
         :raises: ParameterNotFoundError - In case the component is not found
         """
-        regx = re.compile(PARAM_REGEX % param, re.IGNORECASE)
+        regx = param_regex(param)
         line_no, match = self._get_line_matching('.PARAM', regx)
         if match:
             return match.group('value')
@@ -474,17 +818,19 @@ class SpiceCircuit(BaseEditor):
 
         :return: Nothing
         """
-        regx = re.compile(PARAM_REGEX % param, re.IGNORECASE)
+        regx = param_regex(param)
         param_line, match = self._get_line_matching('.PARAM', regx)
         if match:
-            start, stop = match.span(regx.groupindex['replace'])
+            start, stop = match.span(PARAM_REPLACE_GROUP)
             line: str = self.netlist[param_line]
-            self.netlist[param_line] = line[:start] + "{}={}".format(param, value) + line[stop:]
+            self._replace_line(param_line, line[:start] + "{}={}".format(param, value) + line[stop:])
         else:
             # Was not found
             # the last two lines are typically (.backano and .end)
             insert_line = len(self.netlist) - 2
             self.netlist.insert(insert_line, '.PARAM {}={}  ; Batch instruction'.format(param, value) + END_LINE_TERM)
+            self._designator_index = None  # Line numbers after the insertion point have shifted
+            self._invalidate_serialization()
 
     def set_component_value(self, device: str, value: Union[str, int, float]) -> None:
         """Changes the value of a component, such as a Resistor, Capacitor or Inductor. For components inside
@@ -580,18 +926,14 @@ class SpiceCircuit(BaseEditor):
             A list of components matching the prefixes demanded.
         """
         answer = []
-        if prefixes == '*':
-            prefixes = ''.join(REPLACE_REGXES.keys())
-        for line in self.netlist:
-            if isinstance(line, SpiceCircuit):  # Only gets components from the main netlist,
-                # it currently skips sub-circuits
-                continue
-            tokens = line.split()
-            try:
-                if tokens[0][0] in prefixes:
-                    answer.append(tokens[0])  # Appends only the designators
-            except IndexError or TypeError:
-                pass
+        prefixes_set = frozenset(REPLACE_REGXES if prefixes == '*' else prefixes)
+        netlist = self.netlist
+        for line_no in self._string_line_numbers():  # Only gets components from the main netlist,
+            # it currently skips sub-circuits
+            line = netlist[line_no]
+            tokens = line.split(None, 1)  # Only the designator token is needed, no full tokenization
+            if tokens and tokens[0][0] in prefixes_set:
+                answer.append(tokens[0])  # Appends only the designators
         return answer
 
     def remove_component(self, designator: str) -> None:
@@ -606,7 +948,7 @@ class SpiceCircuit(BaseEditor):
         :raises: ComponentNotFoundError - When the component doesn't exist on the netlist.
         """
         line = self._get_line_starting_with(designator)
-        self.netlist[line] = ''  # Blanks the line
+        self._replace_line(line, '')  # Blanks the line
 
     @staticmethod
     def add_library_search_paths(paths: Union[str, List[str]]) -> None:
@@ -634,17 +976,26 @@ class SpiceCircuit(BaseEditor):
         :returns: Circuit Nodes
         :rtype: list[str]
         """
-        circuit_nodes = []
-        for line in self.netlist:
-            prefix = get_line_command(line)
-            if prefix in component_replace_regexs:
-                match = component_replace_regexs[prefix].match(line)
+        # An insertion-ordered dict deduplicates in O(1) while keeping the first-seen order; the
+        # previous "append if not in list" pattern was O(N^2) on the total node count.
+        circuit_nodes = {}
+        for line_no in self._string_line_numbers():  # Skips the embedded sub-circuit objects
+            line = self.netlist[line_no]
+            # Dispatching on the leading character directly: one cheap tokenizer match selects the
+            # component regex, instead of building the full command string for every line. Building a
+            # single alternation of all component patterns is not possible, as they rely on numbered
+            # conditional group references that an alternation would renumber.
+            m = _line_cmd_regex.match(line)
+            if m is None:
+                continue
+            regex = component_replace_regexs.get(m.group(1).upper())
+            if regex is not None:
+                match = regex.match(line)
                 if match:
                     nodes = match.group('nodes').split()  # This separates by all space characters including \t
                     for node in nodes:
-                        if node not in circuit_nodes:
-                            circuit_nodes.append(node)
-        return circuit_nodes
+                        circuit_nodes[node] = None
+        return list(circuit_nodes)
 
     def reset_netlist(self) -> None:
         pass
@@ -680,6 +1031,22 @@ class SpiceEditor(SpiceCircuit):
 
     def __init__(self, netlist_file: Union[str, Path], encoding='autodetect', create_blank=False):
         super().__init__()
+        # Serialization cache: flattened list of the lines to be written on the netlist file.
+        # Single line edits are spliced into it, so that on a sweep each write_netlist call only pays
+        # for the lines that actually changed. _serial_map maps top level line numbers to positions
+        # on the cached list.
+        self._serial_cache = None
+        self._serial_map = {}
+        # Cached positions used by add_instruction, validated against the current content before
+        # use, so a stale index after an insertion just causes one rescan.
+        self._unique_instr_line = None
+        self._backanno_line = None
+        # Lazy set of the netlist lines, backing the duplicate check of add_instruction.
+        self._netlist_set = None
+        # In-memory snapshot of the parsed netlist. reset_netlist restores from it as long as the
+        # file on disk is unchanged, sparing the re-read and re-parse on every sweep iteration.
+        self._pristine_netlist = None
+        self._pristine_signature = None
         self.netlist_file = Path(netlist_file)
         if self.circuit_file.suffix != '.net':
             _logger.warning(f"Netlist file with wrong suffix {self.netlist_file.suffix}")
@@ -701,22 +1068,61 @@ class SpiceEditor(SpiceCircuit):
     def circuit_file(self) -> Path:
         return self.netlist_file
 
+    def _replace_line(self, line_no: int, new_line: str) -> None:
+        if self._netlist_set is not None:
+            old_line = self.netlist[line_no]
+            if isinstance(old_line, str):
+                self._netlist_set.discard(old_line)
+            self._netlist_set.add(new_line)
+        super()._replace_line(line_no, new_line)
+        if self._serial_cache is not None:
+            pos = self._serial_map.get(line_no)
+            if pos is not None:
+                self._serial_cache[pos] = new_line
+            else:
+                self._serial_cache = None  # The line is not individually mapped. Rebuild on next write.
+
+    def _invalidate_serialization(self) -> None:
+        self._serial_cache = None
+
+    def _serialize(self) -> List[str]:
+        """Internal function. Do not use.
+        Builds, and caches, the flattened list of lines to be written to the netlist file. The cache is
+        kept up to date by _replace_line and dropped on any structural change. Note that editing a
+        sub-circuit directly, without going through this class, will not be noticed; use the
+        'X1:R1' style references instead."""
+        if self._serial_cache is None:
+            self._serial_map = {}
+            cache = []
+            for line_no, line in enumerate(self.netlist):
+                if isinstance(line, SpiceCircuit):
+                    line._flatten(cache)
+                else:
+                    # Writes the modified sub-circuits at the end just before the .END clause
+                    if line.upper().startswith(".END"):
+                        for sub in self.modified_subcircuits.values():
+                            sub._flatten(cache)
+                    self._serial_map[line_no] = len(cache)
+                    cache.append(line)
+            self._serial_cache = cache
+        return self._serial_cache
+
     def _set_model_and_value(self, component, value):
         prefix = component[0]  # Using the first letter of the component to identify what is it
         if prefix == 'X' and SUBCKT_DIVIDER in component:  # Relaces a component inside of a subciruit
             # In this case the sub-circuit needs to be copied so that is copy is modified. A copy is created for each
             # instance of a sub-circuit.
-            component_split = component.split(SUBCKT_DIVIDER)
-            modified_path = SUBCKT_DIVIDER.join(component_split[:-1])  # excludes last component
-            component = component_split[-1]  # This is the last component to modify
+            self._invalidate_serialization()  # The edit happens inside a sub-circuit, not on a mapped line
+            # The split of the reference and the rename suffix are memoized across calls
+            modified_path, component, name_suffix = _split_component_path(component)
 
             if modified_path in self.modified_subcircuits:  # See if this was already a modified sub-circuit instance
                 sub_circuit = self.modified_subcircuits[modified_path]
             else:
                 sub_circuit_original = self._get_subckt(modified_path)  # If not will look for it.
                 if sub_circuit_original:
-                    new_name = sub_circuit_original.name() + '_' + '_'.join(
-                        component_split[:-1])  # Creates a new name with the path appended
+                    new_name = sub_circuit_original.name() + '_' + name_suffix
+                    # Creates a new name with the path appended
                     sub_circuit = sub_circuit_original.clone(new_name=new_name)
                     # Memorize that the copy is relative to that particular instance
                     self.modified_subcircuits[modified_path] = sub_circuit
@@ -747,30 +1153,96 @@ class SpiceEditor(SpiceCircuit):
         """
         if not instruction.endswith(END_LINE_TERM):
             instruction += END_LINE_TERM
-        if _is_unique_instruction(instruction):
+        # The command is parsed once and reused by both checks below
+        cmd = get_line_command(instruction)
+        if cmd in UNIQUE_SIMULATION_DOT_INSTRUCTIONS:
             # Before adding new instruction, delete previously set unique instructions
-            i = 0
-            while i < len(self.netlist):
-                line = self.netlist[i]
-                if _is_unique_instruction(line):
-                    self.netlist[i] = instruction
-                    break
-                else:
-                    i += 1
-        elif get_line_command(instruction) == '.PARAM':
+            line_no = self._find_unique_instr_line()
+            if line_no is not None:
+                self._replace_line(line_no, instruction)
+        elif cmd == '.PARAM':
             # raise RuntimeError('The .PARAM instruction should be added using the "set_parameter" method')
             _logger.warning('The .PARAM instruction should be added using the "set_parameter" method')
 
         # check whether the instruction is already there (dummy proofing)
         # TODO: if adding a .MODEL or .SUBCKT it should verify if it already exists and update it.
-        if instruction not in self.netlist:
+        if instruction not in self._netlist_membership():
             # Insert before backanno instruction
-            try:
-                line = self.netlist.index(
-                    '.backanno\n')  # TODO: Improve this. END of line termination could be differnt and case as well
-            except ValueError:
-                line = len(self.netlist) - 2  # This is where typically the .backanno instruction is
+            line = self._find_backanno_line()
             self.netlist.insert(line, instruction)
+            self._netlist_set.add(instruction)
+            if self._backanno_line is not None:
+                self._backanno_line += 1  # The insertion shifted it; keeps the cache warm
+            self._index_insertion(line, instruction)
+            self._invalidate_serialization()
+
+    def _index_insertion(self, line_no: int, instruction: str) -> None:
+        """Internal function. Do not use.
+        Patches the designator index after an instruction was inserted at line_no, instead of
+        dropping it. Only positions at or past the insertion point shift, and for add_instruction
+        that point sits right before the closing lines, so without this every add forced a full
+        O(N) index rebuild on the next component edit."""
+        index = self._designator_index
+        if index is None:
+            return
+        for token, pos in index.items():
+            if pos >= line_no:
+                index[token] = pos + 1
+        token = sys.intern(_first_token_upped(instruction))
+        prev = index.get(token)
+        if prev is None or prev > line_no:
+            index[token] = line_no  # The new line is now the first occurrence of this token
+        str_nos = self._str_line_nos
+        i = bisect.bisect_left(str_nos, line_no)
+        for j in range(i, len(str_nos)):
+            str_nos[j] += 1
+        str_nos.insert(i, line_no)
+
+    def _netlist_membership(self) -> set:
+        """Internal function. Do not use.
+        Returns the set of netlist lines used by the duplicate check of add_instruction, making it
+        O(1) instead of a scan. Built lazily from the current content; _replace_line keeps it in
+        sync and reset_netlist drops it."""
+        if self._netlist_set is None:
+            self._netlist_set = {line for line in self.netlist if isinstance(line, str)}
+        return self._netlist_set
+
+    def _find_unique_instr_line(self) -> Union[int, None]:
+        """Internal function. Do not use.
+        Returns the position of the first unique simulation instruction, or None. The position is
+        cached and verified against the current line content, so repeated add_instruction calls skip
+        the netlist scan unless an edit moved the line."""
+        netlist = self.netlist
+        line_no = self._unique_instr_line
+        if line_no is not None and line_no < len(netlist):
+            line = netlist[line_no]
+            if isinstance(line, str) and _is_unique_instruction(line):
+                return line_no
+        for line_no, line in enumerate(netlist):
+            if _is_unique_instruction(line):
+                self._unique_instr_line = line_no
+                return line_no
+        self._unique_instr_line = None
+        return None
+
+    def _find_backanno_line(self) -> int:
+        """Internal function. Do not use.
+        Returns the position where new instructions are inserted: the .backanno line if there is
+        one, the penultimate line otherwise. Cached with content validation, like the unique
+        instruction position."""
+        netlist = self.netlist
+        line_no = self._backanno_line
+        backanno = '.backanno' + END_LINE_TERM
+        if line_no is not None and line_no < len(netlist) and netlist[line_no] == backanno:
+            return line_no
+        try:
+            # TODO: Improve this. END of line termination could be differnt and case as well
+            line_no = netlist.index(backanno)
+        except ValueError:
+            self._backanno_line = None
+            return len(netlist) - 2  # This is where typically the .backanno instruction is
+        self._backanno_line = line_no
+        return line_no
 
     def remove_instruction(self, instruction) -> None:
         """Usage a previously added instructions.
@@ -793,6 +1265,12 @@ class SpiceEditor(SpiceCircuit):
             instruction += END_LINE_TERM
 
         self.netlist.remove(instruction)
+        if self._netlist_set is not None:
+            self._netlist_set.discard(instruction)
+        self._designator_index = None
+        self._unique_instr_line = None
+        self._backanno_line = None
+        self._invalidate_serialization()
 
     def write_netlist(self, run_netlist_file: Union[str, Path]) -> None:
         """
@@ -805,18 +1283,13 @@ class SpiceEditor(SpiceCircuit):
         if isinstance(run_netlist_file, str):
             run_netlist_file = Path(run_netlist_file)
         run_netlist_file = run_netlist_file.with_suffix('.net')
-        with open(run_netlist_file, 'w', encoding=self.encoding) as f:
-            lines = iter(self.netlist)
-            for line in lines:
-                if isinstance(line, SpiceCircuit):
-                    line.write_lines(f)
-                else:
-                    # Writes the modified sub-circuits at the end just before the .END clause
-                    if line.upper().startswith(".END"):
-                        # write here the modified sub-circuits
-                        for sub in self.modified_subcircuits.values():
-                            sub.write_lines(f)
-                    f.write(line)
+        # The 1 MiB buffer lets the encoded text reach the OS in a few large writes instead of one
+        # syscall per 8 KiB default buffer fill.
+        with open(run_netlist_file, 'w', encoding=self.encoding, buffering=1 << 20) as f:
+            # The expansion of the netlist is cached, so that on a sweep only the first write pays
+            # for walking the netlist structure. The lines are streamed into the wide buffer as
+            # they are, which spares building one joined copy of the whole netlist per write.
+            f.writelines(self._serialize())
 
     def reset_netlist(self) -> None:
         """
@@ -826,7 +1299,25 @@ class SpiceEditor(SpiceCircuit):
         """
         self.netlist.clear()
         self.modified_subcircuits.clear()
+        self._designator_index = None
+        self._value_span_cache.clear()
+        self._cached_name = None
+        self._unique_instr_line = None
+        self._backanno_line = None
+        self._netlist_set = None
+        self._invalidate_serialization()
         if self.netlist_file.exists():
+            try:
+                stat = self.netlist_file.stat()
+                signature = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                signature = None
+            if signature is not None and signature == self._pristine_signature:
+                # The file has not changed since it was parsed: restore the snapshot instead of
+                # re-reading it. Strings are immutable and shared; sub-circuits get fresh copies.
+                self.netlist.extend(line if isinstance(line, str) else line._pristine_copy()
+                                    for line in self._pristine_netlist)
+                return
             with open(self.netlist_file, 'r', encoding=self.encoding, errors='replace') as f:
                 lines = iter(f)  # Creates an iterator object to consume the file
                 finished = self._add_lines(lines)
@@ -835,6 +1326,10 @@ class SpiceEditor(SpiceCircuit):
                 # else:
                 #     for _ in lines:  # Consuming the rest of the file.
                 #         pass  # print("Ignoring %s" % _)
+            # Keep a snapshot of the freshly parsed netlist for the next reset.
+            self._pristine_netlist = [line if isinstance(line, str) else line._pristine_copy()
+                                      for line in self.netlist]
+            self._pristine_signature = signature
         elif self.create_blank:
             lines = ['* netlist generated from newSpice', '.end']
             finished = self._add_lines(lines)
@@ -855,21 +1350,35 @@ class SpiceEditor(SpiceCircuit):
         :return: Returns a SpiceCircuit instance with the sub-circuit found or None if not found
         :rtype: SpiceCircuit
         """
-        # 0. Setup things
-        reg_subckt = re.compile(SUBCKT_CLAUSE_FIND + subckt_name, re.IGNORECASE)
-        # 1. Find Encoding
-        encoding = detect_encoding(library)
-        #  2. scan the file
-        with open(library, encoding=encoding) as lib:
-            for line in lib:
-                search = reg_subckt.match(line)
-                if search:
-                    sub_circuit = SpiceCircuit()
-                    sub_circuit.netlist.append(line)
-                    # Advance to the next non nested .ENDS
-                    finished = sub_circuit._add_lines(lib)
-                    if finished:
-                        return sub_circuit
+        # 1. Obtain the library index, built on first access and shared by all lookups
+        try:
+            stat = os.stat(library)
+        except OSError:
+            return None
+        encoding, offset_kind, index = _index_library(str(library), stat.st_mtime_ns, stat.st_size)
+        offset = index.get(subckt_name.upper())
+        if offset is None:
+            return None
+        #  2. Seek straight to the .SUBCKT clause and parse from there
+        if offset_kind == 'b':
+            with open(library, 'rb') as lib:
+                lib.seek(offset)
+                tail = lib.read().decode(encoding)
+            line_iter = iter(tail.splitlines(keepends=True))
+        else:
+            with open(library, encoding=encoding) as lib:
+                lib.seek(offset)
+                line_iter = iter(lib.read().splitlines(keepends=True))
+        line = next(line_iter, '')
+        sub_circuit = SpiceCircuit()
+        sub_circuit.netlist.append(line)
+        m = subckt_regex.search(line)
+        if m:
+            sub_circuit._cached_name = m.group('name')
+        # Advance to the next non nested .ENDS
+        finished = sub_circuit._add_lines(line_iter)
+        if finished:
+            return sub_circuit
         #  3. Return an instance of SpiceCircuit
         return None
 
@@ -885,10 +1394,14 @@ class SpiceEditor(SpiceCircuit):
         return Sim.run(self, wait_resource=wait_resource, callback=callback, timeout=timeout, run_filename=run_filename)
 
 
-if __name__ == '__main__':
+def _demo():
     E = SpiceEditor(os.path.abspath('..\\tests\\PI_Filter_resampled.net'))
     E.add_instruction(".nodeset V(N001)=0")
     E.write_netlist('..\\tests\\PI_Filter_resampled_mod.net')
+
+
+if __name__ == '__main__':
+    _demo()
     E = SpiceEditor('..\\tests\\Editor_Test.net')
     print("Circuit Nodes", E.get_all_nodes())
     E.add_library_search_paths([r"C:\SVN\Electronic_Libraries\LTSpice\lib"])
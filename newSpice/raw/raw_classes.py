@@ -97,9 +97,11 @@ class Axis(DataSet):
     def __init__(self, name: str, whattype: str, datalen: int, numerical_type: str = 'double'):
         super().__init__(name, whattype, datalen, numerical_type)
         self.step_info = None
+        self._wave_cache = {}  # per-step axis slices, see get_wave()
 
     def _set_steps(self, step_info: List[dict]):
         self.step_info = step_info
+        self._wave_cache.clear()  # slices cached before the offsets were known are invalid
 
         self.step_offsets = [None for _ in range(len(step_info))]
 
@@ -152,14 +154,18 @@ class Axis(DataSet):
         :return: The trace values
         :rtype: numpy.array
         """
-        if step == 0:
-            wave = self.data[:self.step_offset(1)]
-        else:
-            wave = self.data[self.step_offset(step):self.step_offset(step + 1)]
-        if self.name == 'time':  # This is a bug in LTSpice, where the time axis values are sometimes negative
-            return np.abs(wave)
-        else:
-            return wave
+        # The per-step slice, and the abs() copy taken for the time axis, is computed once per
+        # step and memoized: get_position() and the interpolation methods request it repeatedly.
+        wave = self._wave_cache.get(step)
+        if wave is None:
+            if step == 0:
+                wave = self.data[:self.step_offset(1)]
+            else:
+                wave = self.data[self.step_offset(step):self.step_offset(step + 1)]
+            if self.name == 'time':  # This is a bug in LTSpice, where the time axis values are sometimes negative
+                wave = np.abs(wave)
+            self._wave_cache[step] = wave
+        return wave
 
     def get_time_axis(self, step: int = 0):
         """
@@ -213,15 +219,18 @@ class Axis(DataSet):
             timex = self.get_time_axis(step)
         else:
             timex = self.get_wave(step)
-        for i, x in enumerate(timex):
-            if x == t:
-                return i
-            elif x > t:
-                # Needs to interpolate the data
-                if i == 0:
-                    raise IndexError("Time position is lower than t0")
-                frac = (t - timex[i-1])/(timex[i] - timex[i-1])
-                return i - 1 + frac
+        # Binary search on the cached axis slice; the axis is monotonic, so this replaces the
+        # previous linear scan with the same exact-match, interpolation and error semantics.
+        i = int(np.searchsorted(timex, t))
+        if i >= len(timex):
+            return None  # t lies beyond the end of the axis
+        if timex[i] == t:
+            return i
+        if i == 0:
+            raise IndexError("Time position is lower than t0")
+        # Needs to interpolate the data
+        frac = (t - timex[i-1])/(timex[i] - timex[i-1])
+        return i - 1 + frac
 
     def get_len(self, step: int = 0) -> int:
         """
@@ -329,6 +338,31 @@ class TraceRead(DataSet):
         else:
             return self.get_point(pos, step)
 
+    def get_points_at(self, times, step: int = 0) -> np.ndarray:
+        """
+        Vectorized version of get_point_at(). Returns the trace values at all the points given in the /times/
+        argument at once. Points that don't exist on the axis are interpolated linearly between the two adjacent
+        points, exactly as in get_point_at(), but the axis is searched with a single numpy searchsorted call
+        instead of one scan per requested point.
+
+        :param times: points in the axis where to find the values
+        :type times: sequence of floats or numpy.ndarray
+        :param step: step index
+        :type step: int
+        :return: the trace values at the requested points
+        :rtype: numpy.ndarray
+        """
+        times = np.asarray(times)
+        axis_wave = self.axis.get_wave(step)
+        wave = self.get_wave(step)
+        if np.any(times < axis_wave[0]):
+            raise IndexError("Time position is lower than t0")
+        if np.any(times > axis_wave[-1]):
+            raise IndexError(f"The highest axis point is {axis_wave[-1]}. Received {times.max()}")
+        i = np.clip(np.searchsorted(axis_wave, times), 1, len(axis_wave) - 1)
+        frac = (times - axis_wave[i - 1]) / (axis_wave[i] - axis_wave[i - 1])
+        return wave[i - 1] + frac * (wave[i] - wave[i - 1])
+
     def get_len(self, step: int = 0) -> int:
         """
         Returns the length of the axis.
@@ -207,6 +207,7 @@ library to plot the results of three traces in two subplots. ::
 __author__ = "Nuno Canto Brum <nuno.brum@gmail.com>"
 __copyright__ = "Copyright 2022, Fribourg Switzerland"
 
+import mmap
 import os
 
 from collections import OrderedDict
@@ -412,6 +413,7 @@ class RawRead(object):
         has_axis = self.raw_params['Plotname'] not in ('Operating Point', 'Transfer Function',)
         reading_qspice = 'QSPICE' in self.raw_params['Command']
         self._traces = []
+        self._trace_index = None  # name -> trace dict, built lazily on the first get_trace()
         self.steps = None
         self.axis = None  # Creating the axis
         self.flags = self.raw_params['Flags'].split()
@@ -467,32 +469,17 @@ class RawRead(object):
             # But first check whether how data is stored.
             self.block_size = (raw_file_size - binary_start) // self.nPoints
 
-            scan_functions = []
             calc_block_size = 0
             for trace in self._traces:
                 if trace.numerical_type == 'double':
                     calc_block_size += 8
-                    if isinstance(trace, DummyTrace):
-                        fun = consume8bytes
-                    else:
-                        fun = read_float64
                 elif trace.numerical_type == 'complex':
                     calc_block_size += 16
-                    if isinstance(trace, DummyTrace):
-                        fun = consume16bytes
-                    else:
-                        fun = read_complex
                 elif trace.numerical_type == 'real':  # data size is only 4 bytes
                     calc_block_size += 4
-                    if isinstance(trace, DummyTrace):
-                        fun = consume4bytes
-                    else:
-                        fun = read_float32
-
                 else:
                     raise RuntimeError(
                         "Invalid data type {} for trace {}".format(trace.numerical_type, trace.name))
-                scan_functions.append(fun)
             if calc_block_size != self.block_size:
                 raise RuntimeError(
                     "Error in calculating the block size. Expected {} bytes, but found {} bytes".format(
@@ -523,12 +510,30 @@ class RawRead(object):
             else:
                 if self.verbose:
                     _logger.debug("Binary RAW file with Normal access")
-                # This is the default save after a simulation where the traces are scattered
-                for point in range(self.nPoints):
-                    for i, var in enumerate(self._traces):
-                        value = scan_functions[i](raw_file)
-                        if value is not None and not isinstance(var, DummyTrace):
-                            var.data[point] = value
+                # This is the default save after a simulation where the traces are scattered.
+                # The binary section is memory-mapped and each trace is gathered out of the
+                # interleaved point blocks with one strided numpy copy per trace, instead of one
+                # Python-level unpack per value. The kernel page cache then serves repeated opens
+                # of the same file without copying it into Python bytes first.
+                mm = mmap.mmap(raw_file.fileno(), 0, access=mmap.ACCESS_READ)
+                blocks = np.frombuffer(mm, dtype=np.uint8, count=self.nPoints * self.block_size,
+                                       offset=binary_start).reshape(self.nPoints, self.block_size)
+                offset = 0
+                for var in self._traces:
+                    if var.numerical_type == 'double':
+                        size, dtype = 8, float64
+                    elif var.numerical_type == 'complex':
+                        size, dtype = 16, complex128
+                    else:  # 'real', checked above when the block size was calculated
+                        size, dtype = 4, float32
+                    if not isinstance(var, DummyTrace):
+                        # copy() detaches the data from the mapping; a view would keep the whole
+                        # file mapped for as long as any trace is alive.
+                        var.data = blocks[:, offset:offset + size].copy().view(dtype) \
+                            .reshape(self.nPoints)
+                    offset += size
+                del blocks  # drop the buffer export so the mapping can close
+                mm.close()
 
         elif self.raw_type == "Values:":
             if self.verbose:
@@ -626,10 +631,14 @@ class RawRead(object):
         :raises IndexError: When a trace is not found
         """
         if isinstance(trace_ref, str):
-            for trace in self._traces:
-                if trace_ref.upper() == trace.name.upper():  # The trace names are case-insensitive
-                    # assert isinstance(trace, DataSet)
-                    return trace
+            # The trace names are case-insensitive. Lookups go through a dict keyed on the
+            # upper-cased name, built on first use, instead of scanning the trace list per call.
+            if self._trace_index is None or len(self._trace_index) != len(self._traces):
+                self._trace_index = {trace.name.upper(): trace for trace in self._traces}
+            trace = self._trace_index.get(trace_ref.upper())
+            if trace is not None:
+                # assert isinstance(trace, DataSet)
+                return trace
             raise IndexError(f"{self} doesn't contain trace \"{trace_ref}\"\n"
                              f"Valid traces are {[trc.name for trc in self._traces]}")
         else:
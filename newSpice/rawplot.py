@@ -27,7 +27,7 @@ def main():
     import matplotlib.pyplot as plt
 
     from numpy import abs as mag, angle as phase_np
-    from numpy import angle, arange
+    from numpy import angle, arange, full_like, log10, nan
 
     from newSpice import RawRead
 
@@ -39,6 +39,9 @@ def main():
             return 'A'
 
     matplotlib.use('tkagg')
+    # Lets Agg split very long AC sweeps into chunks while rasterizing, instead of building one
+    # huge path object.
+    matplotlib.rcParams['agg.path.chunksize'] = 10000
 
     if len(sys.argv) > 2:
         raw_filename = sys.argv[1]
@@ -60,43 +63,57 @@ def main():
         print("Reading all the traces in the raw file")
         trace_names = LTR.get_trace_names()
 
-    traces = [LTR.get_trace(trace) for trace in trace_names]
     if LTR.axis is not None:
         steps_data = LTR.get_steps()
     else:
         steps_data = [0]
     print("Steps read are :", list(steps_data))
 
-    n_axis = len(traces)
+    n_axis = len(trace_names)
+
+    # The x axis is shared by every trace, so its per-step values, and their magnitude on complex
+    # sweeps, are fetched once here instead of once per trace drawn. A prefetch thread for the y
+    # data was considered but brings nothing: get_wave slices arrays already read into memory.
+    if LTR.axis:
+        x_data = {step_i: LTR.get_axis(step_i) for step_i in steps_data}
+    else:
+        x_data = {step_i: arange(LTR.nPoints) for step_i in steps_data}
+    if 'complex' in LTR.flags:
+        x_data = {step_i: mag(x) for step_i, x in x_data.items()}
 
     fig, axis_set = plt.subplots(nrows=n_axis, ncols=1, sharex='all')
 
     if n_axis == 1:
         axis_set = [axis_set]  # Needs to have a list of axis
 
-    for i, trace in enumerate(traces):
+    for i, trace_name in enumerate(trace_names):
+        # Each trace is looked up when its axis is drawn, instead of materializing the whole list
+        # of traces up front.
+        trace = LTR.get_trace(trace_name)
         ax = axis_set[i]
 
         ax.grid(True)
         if 'log' in LTR.flags:
             ax.set_xscale('log')
         for step_i in steps_data:
-            if LTR.axis:
-                x = LTR.get_axis(step_i)
-            else:
-                x = arange(LTR.nPoints)
-            y = traces[i].get_wave(step_i)
+            x = x_data[step_i]
+            y = trace.get_wave(step_i)
             label = f"{trace.name}:{steps_data[step_i]})"
             if 'complex' in LTR.flags:
-                x = mag(x)
-                ax.set_yscale('log')
-                y = mag(y)
+                # Magnitude and phase are both taken from the original complex wave in one pass
+                # each. The previous code overwrote y with its magnitude first, so the phase was
+                # computed on a real array and plotted as all zeros.
+                y_mag = mag(y)
+                # The dB values are computed once and drawn on a linear axis. With set_yscale('log')
+                # matplotlib would re-run the log transform on every redraw, pan and zoom included.
+                # Zero magnitude points become NaN and are simply not drawn.
+                y_db = 20 * log10(y_mag, where=y_mag > 0, out=full_like(y_mag, nan))
+                y_phase = phase_np(y, deg=True)
                 ax.yaxis.label.set_color('blue')
                 ax.set(ylabel=label+'(dB)')
-                ax.plot(x, y)
+                ax.plot(x, y_db)
                 ax_phase = ax.twinx()
-                y = phase_np(y, deg=True)
-                ax_phase.plot(x, y, color='red', linestyle='-.')
+                ax_phase.plot(x, y_phase, color='red', linestyle='-.')
                 ax_phase.yaxis.label.set_color('red')
                 ax_phase.set(ylabel=label+'Phase (o)')
                 # title = f"{trace.name} Phase [deg]"
@@ -23,9 +23,62 @@
 """
 from __future__ import annotations
 
-from multiprocessing import Process, Queue
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import Process, Queue, shared_memory
 from typing import Any
 
+import numpy as np
+
+# Tag identifying a result that was placed on shared memory instead of the queue
+_SHM_NDARRAY = '__shm_ndarray__'
+
+# Workers of this pool are reused by every ProcessCallback, so the interpreter start-up and the
+# imports of the callback module are paid once per worker instead of once per simulation.
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _encode_result(ret: Any) -> Any:
+    """Moves ndarray results onto a shared memory segment, returning the small descriptor that is
+    sent over the IPC channel instead. Anything else passes through unchanged."""
+    if isinstance(ret, np.ndarray) and ret.nbytes > 0:
+        shm = shared_memory.SharedMemory(create=True, size=ret.nbytes)
+        np.ndarray(ret.shape, dtype=ret.dtype, buffer=shm.buf)[...] = ret
+        descriptor = (_SHM_NDARRAY, shm.name, ret.shape, ret.dtype.str)
+        shm.close()
+        try:
+            # The segment must outlive this process: the receiving side unlinks it after copying.
+            # Without this, the resource tracker of the sender would remove it first.
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(shm._name, 'shared_memory')
+        except Exception:
+            pass
+        return descriptor
+    return ret
+
+
+def _decode_result(ret: Any) -> Any:
+    """Counterpart of _encode_result on the receiving side."""
+    if isinstance(ret, tuple) and len(ret) == 4 and ret[0] == _SHM_NDARRAY:
+        _, name, shape, dtype = ret
+        shm = shared_memory.SharedMemory(name=name)
+        try:
+            return np.ndarray(shape, dtype=dtype, buffer=shm.buf).copy()
+        finally:
+            shm.close()
+            shm.unlink()
+    return ret
+
+
+def _pool_run(callback_cls, raw, log, kwargs) -> Any:
+    """Executed on a pool worker: runs the callback of the given class."""
+    ret = callback_cls.callback(raw, log, **kwargs)
+    if ret is None:
+        ret = "Callback doesn't return anything"
+    return _encode_result(ret)
+
 
 class ProcessCallback(Process):
     """
@@ -39,11 +92,54 @@ class ProcessCallback(Process):
         self.log_file = log
         self.kwargs = kwargs
 
+    @staticmethod
+    def get_pool(max_workers: int = None) -> ProcessPoolExecutor:
+        """Returns the process pool shared by all ProcessCallback executions, creating it on first
+        use. max_workers is only honoured by that first call."""
+        global _pool
+        with _pool_lock:
+            if _pool is None:
+                _pool = ProcessPoolExecutor(max_workers=max_workers)
+            return _pool
+
     def run(self):
         ret = self.callback(self.raw_file, self.log_file, **self.kwargs)
         if ret is None:
             ret = "Callback doesn't return anything"
-        self.queue.put(ret)
+        self.queue.put(_encode_result(ret))
+
+    def execute(self) -> Any:
+        """Runs the callback on the shared worker pool and returns its result. Spawning one
+        Process per callback is kept as fallback for classes the pool cannot ship to a worker."""
+        try:
+            future = self.get_pool().submit(_pool_run, type(self), self.raw_file, self.log_file,
+                                            self.kwargs)
+        except Exception:
+            return self._run_detached()
+        try:
+            return _decode_result(future.result())
+        except BrokenProcessPool:
+            # The workers died without an answer, typically because the callback class cannot be
+            # re-imported on their side (e.g. defined in __main__ under the spawn start method).
+            # A dedicated process inherits it instead. The broken pool is dropped so the next
+            # callback can rebuild a healthy one. Exceptions raised by the callback itself
+            # propagate above and are never retried here.
+            global _pool
+            with _pool_lock:
+                _pool = None
+            return self._run_detached()
+
+    def _run_detached(self) -> Any:
+        """Runs the callback on its own dedicated process, the pre-pool behavior."""
+        self.start()
+        ret = self.fetch_return()
+        self.join()
+        return ret
+
+    def fetch_return(self) -> Any:
+        """Reads the result posted by the child process, transparently reassembling ndarray
+        results sent over shared memory. To be called by the parent process."""
+        return _decode_result(self.queue.get())
 
     @staticmethod
     def callback(raw_file, log_file, **kwargs) -> Any:
@@ -67,9 +67,11 @@ class RunTask(threading.Thread):
     def __init__(self, simulator: Type[Simulator], runno, netlist_file: Path,
                  callback: Union[Type[ProcessCallback], Callable[[Path, Path], Any]],
                  callback_args: dict = None,
-                 switches: Any = None, timeout: float = None, verbose=True):
+                 switches: Any = None, timeout: float = None, verbose=True,
+                 completion_queue=None):
 
         super().__init__(name=f"RunTask#{runno}")
+        self.completion_queue = completion_queue  # When given, the task posts itself here once finished
         self.start_time = None
         self.stop_time = None
         self.verbose = verbose
@@ -92,12 +94,22 @@ class RunTask(threading.Thread):
             print(f"{time.asctime()} {logger_fun.__name__}: {message}{END_LINE_TERM}")
 
     def run(self):
+        try:
+            self._run()
+        finally:
+            if self.completion_queue is not None:
+                # Signals whoever is waiting on the queue that this task is done, avoiding any polling
+                self.completion_queue.put(self)
+
+    def _run(self):
         # Running the Simulation
 
         self.start_time = clock_function()
         self.print_info(_logger.info, ": Starting simulation %d" % self.runno)
 
-        # start execution
+        # start execution. The simulator writes its log straight to a file (or the inherited
+        # console): no pipes are opened here, so this thread blocks in waitpid and there is no
+        # per-simulation stdout reader to multiplex.
         self.retcode = self.simulator.run(self.netlist_file.absolute().as_posix(), self.switches, self.timeout)
         self.stop_time = clock_function()
         # print simulation time with format HH:MM:SS.mmmmmm
@@ -131,10 +143,9 @@ class RunTask(threading.Thread):
                         self.print_info(_logger.error, error)
                     else:
                         if isinstance(return_or_process, ProcessCallback):
-                            proc = return_or_process
-                            proc.start()
-                            self.callback_return = proc.queue.get()
-                            proc.join()
+                            # Runs on the shared worker pool, so the process start-up cost is paid
+                            # once per worker and not once per simulation.
+                            self.callback_return = return_or_process.execute()
                         else:
                             self.callback_return = return_or_process
                     finally:
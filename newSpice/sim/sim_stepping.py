@@ -23,6 +23,9 @@
 __author__ = "Nuno Canto Brum <nuno.brum@gmail.com>"
 __copyright__ = "Copyright 2017, Fribourg Switzerland"
 
+import itertools
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
 from typing import Callable, Any, Union
 from typing import Iterable
 import pathlib
@@ -33,14 +36,51 @@ from ..editor.base_editor import BaseEditor
 from .sim_runner import AnyRunner, SimRunner
 
 
+# Editor method applying each kind of sweep dimension
+_SETTER_METHOD = {'param': 'set_parameter', 'component': 'set_component_value', 'model': 'set_element_model'}
+
+# Marks a sweep value as not applied yet; never equal to any user value
+_UNSET = object()
+
+# Editor of a netlist-materialization worker process, built once per worker by _materialize_init,
+# and the value this worker last applied per (method, element), to skip re-applying it
+_worker_netlist = None
+_worker_last = {}
+
+
+def _materialize_init(editor_cls, base_file: str):
+    """Runs once on each worker of the run_all materialization pool: builds this worker's own
+    editor from the snapshot of the base netlist."""
+    global _worker_netlist
+    _worker_netlist = editor_cls(base_file)
+    _worker_last.clear()
+
+
+def _materialize_job(assignments, dest: str) -> str:
+    """Runs on a worker of the materialization pool: applies one sweep combination to this
+    worker's editor and writes the resulting netlist to dest. Only the dimensions whose value
+    differs from what this worker applied last are edited; since consecutive jobs mostly differ
+    in the fast-varying dimensions, the slow ones are usually already in place."""
+    for method, elem, value in assignments:
+        key = (method, elem)
+        if _worker_last.get(key, _UNSET) != value:
+            getattr(_worker_netlist, method)(elem, value)
+            _worker_last[key] = value
+    _worker_netlist.write_netlist(dest)
+    return dest
+
+
 class StepInfo(object):
     def __init__(self, what: str, elem: str, iterable: Iterable):
         self.what = what
         self.elem = elem
-        self.iter = iterable
+        # Materialized up front: a one-shot generator passed here would otherwise be silently
+        # drained by the first len() call (total_number_of_simulations runs before the sweep),
+        # leaving run_all with an empty dimension.
+        self.iter = tuple(iterable)
 
     def __len__(self):
-        return len(list(self.iter))
+        return len(self.iter)
 
     def __str__(self):
         return f"Iteration on {self.what} {self.elem} : {self.iter}"
@@ -90,6 +130,9 @@ class SimStepper(object):
         self.runner = runner
         self.netlist = circuit
         self.iter_list = []
+        # Sweep driver specialized for the current dimensions, built by _get_driver
+        self._driver = None
+        self._driver_key = None
 
     @wraps(BaseEditor.add_instruction)
     def add_instruction(self, instruction: str):
@@ -150,40 +193,134 @@ class SimStepper(object):
                 _logger.debug(f"'{step}' is empty.")
         return total
 
-    def run_all(self, callback: Callable[[str, str], Any] = None, use_loadbias='Auto', wait_completion=True):
+    def run_all(self, callback: Callable[[str, str], Any] = None, use_loadbias='Auto', wait_completion=True,
+                create_simfile_jobs: int = 1):
+        """Runs the whole sweep product. With create_simfile_jobs > 1 the netlist of each
+        combination is materialized on that many worker processes while the simulations of the
+        previous combinations are running; the default of 1 keeps everything on this thread.
+        The pooled mode requires a file-backed editor (one with a valid ``circuit_file``).
+
+        Submission is pipelined rather than batched: combinations are produced lazily, the pooled
+        mode keeps a bounded window of prepared netlists ahead of the runner, and the runner's
+        run() blocks only when all its simulation slots are busy. The simulator slots therefore
+        stay full for the whole sweep, and the wait_completion at the end only waits for the tail
+        of simulations still in flight."""
         assert use_loadbias in ('Auto', 'Yes', 'No'), "use_loadbias argument must be 'Auto', 'Yes' or 'No'"
         if (use_loadbias == 'Auto' and self.total_number_of_simulations() > 10) or use_loadbias == 'Yes':
             # It will choose to use .SAVEBIAS/.LOADBIAS if the number of simulaitons is higher than 10
             # TODO: Make a first simulation and storing the bias
             pass
-        iter_no = 0
-        iterators = [iter(step.iter) for step in self.iter_list]
-        while True:
-            while 0 <= iter_no < len(self.iter_list):
-                try:
-                    value = iterators[iter_no].__next__()
-                except StopIteration:
-                    iterators[iter_no] = iter(self.iter_list[iter_no].iter)
-                    iter_no -= 1
-                    continue
-                if self.iter_list[iter_no].what == 'param':
-                    self.netlist.set_parameter(self.iter_list[iter_no].elem, value)
-                elif self.iter_list[iter_no].what == 'component':
-                    self.netlist.set_component_value(self.iter_list[iter_no].elem, value)
-                elif self.iter_list[iter_no].what == 'model':
-                    self.netlist.set_element_model(self.iter_list[iter_no].elem, value)
-                else:
-                    # TODO: develop other types of sweeps EX: add .STEP instruction
-                    raise ValueError("Not Supported sweep")
-                iter_no += 1
-            if iter_no < 0:
-                break
-            self.runner.run(self.netlist, callback=callback)  # Like this a recursion is avoided
-            iter_no = len(self.iter_list) - 1  # Resets the counter to start next iteration
+        # The setter of each dimension is resolved once, before the sweep: the inner loop then
+        # dispatches through a list index instead of re-comparing StepInfo.what and re-reading
+        # iter_list attributes on every single step.
+        for step in self.iter_list:
+            if step.what not in _SETTER_METHOD:
+                # TODO: develop other types of sweeps EX: add .STEP instruction
+                raise ValueError("Not Supported sweep")
+        if create_simfile_jobs > 1:
+            self._run_all_pooled(callback, create_simfile_jobs)
+        else:
+            self._get_driver()(callback)
         if wait_completion:
             # Now waits for the simulations to end
             self.runner.wait_completion()
 
+    def _get_driver(self):
+        """Internal function. Returns the function that runs the whole sweep product, built as one
+        nested loop per dimension with the setter, element and values of each level bound in its
+        enclosing scope. Specializing the loop structure this way leaves no what-dispatch, list
+        indexing or odometer bookkeeping in the per-combination path, and an outer level only
+        re-applies its setter when its own value advances, not on every combination. The driver is
+        cached and rebuilt only when the dimensions change."""
+        try:
+            key = (id(self.netlist), tuple((step.what, step.elem, step.iter) for step in self.iter_list))
+        except TypeError:
+            key = None  # Unhashable sweep values: build a fresh driver for this call
+        if key is not None and key == self._driver_key:
+            return self._driver
+
+        def innermost(callback):
+            # Writing a static prefix netlist once and per-run stubs that .include it was
+            # considered and rejected: component and model steps rewrite instance lines, which no
+            # directive in a stub can override, and stacking a second .param definition on top of
+            # the included one resolves differently per simulator. The per-run cost is already
+            # small instead: the editor serializes unchanged lines from its cache, and the runner
+            # skips simulations whose netlist text it has seen before.
+            self.runner.run(self.netlist, callback=callback)
+
+        # Each level remembers the value it last applied in a one-element cell, so a value that is
+        # already on the netlist is not re-applied: single-value dimensions are set once per whole
+        # sweep instead of once per wrap, and duplicated consecutive values cost nothing.
+        inner = innermost
+        cells = []
+        for step in reversed(self.iter_list):
+            last = [_UNSET]
+            cells.append(last)
+
+            def level(callback, _setter=getattr(self.netlist, _SETTER_METHOD[step.what]),
+                      _elem=step.elem, _values=step.iter, _inner=inner, _last=last):
+                for value in _values:
+                    if value != _last[0]:
+                        _setter(_elem, value)
+                        _last[0] = value
+                    _inner(callback)
+            inner = level
+
+        def driver(callback, _outer=inner, _cells=cells):
+            # The cells are cleared per call: between two run_all calls the user may have edited
+            # the netlist directly, so nothing applied by a previous sweep can be trusted.
+            for cell in _cells:
+                cell[0] = _UNSET
+            _outer(callback)
+
+        if key is not None:
+            self._driver = driver
+            self._driver_key = key
+        return driver
+
+    def _run_all_pooled(self, callback, jobs: int):
+        """Internal function. Materializes the netlist of every sweep combination on a pool of
+        worker processes and hands each finished file to the runner, so the netlist edits and
+        writes of upcoming combinations overlap with the simulations already running. Each worker
+        builds its own editor once, from a snapshot of the base netlist that carries the edits
+        done before run_all, and then only receives the per-combination value assignments."""
+        base_file = Path(self.netlist.circuit_file)
+        snapshot = base_file.with_name(f"{base_file.stem}_sweep_base{base_file.suffix}")
+        self.netlist.write_netlist(snapshot)
+        methods = [_SETTER_METHOD[step.what] for step in self.iter_list]
+        names = [step.elem for step in self.iter_list]
+        values = [step.iter for step in self.iter_list]
+        pool = ProcessPoolExecutor(max_workers=jobs, initializer=_materialize_init,
+                                   initargs=(type(self.netlist), str(snapshot)))
+
+        def dispatch(done_futures):
+            for future in done_futures:
+                netlist_file = Path(future.result())
+                self.runner.run(netlist_file, callback=callback)
+                netlist_file.unlink()  # The runner took its own copy under the run number
+
+        # The submission window keeps the pool and the runner fed a bit ahead of the simulations,
+        # without materializing the whole product up front: a deep sweep would otherwise queue
+        # millions of jobs and leave as many netlist files on disk at once. runner.run itself
+        # blocks when all simulation slots are busy, so the window is also the cap on prepared
+        # but not yet scheduled files.
+        window = 2 * max(jobs, getattr(self.runner, 'parallel_sims', jobs))
+        pending = set()
+        try:
+            for k, combo in enumerate(itertools.product(*values)):
+                dest = base_file.with_name(f"{base_file.stem}_sweep{k}{base_file.suffix}")
+                pending.add(pool.submit(_materialize_job, list(zip(methods, names, combo)), str(dest)))
+                if len(pending) >= window:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    dispatch(done)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                dispatch(done)
+        finally:
+            pool.shutdown()
+            if snapshot.exists():
+                snapshot.unlink()
+
     def run(self):
         """Rather uses run_all instead"""
         self.run_all()
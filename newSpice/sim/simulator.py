@@ -28,6 +28,10 @@ if sys.version_info.major >= 3 and sys.version_info.minor >= 6:
     def run_function(command, timeout=None):
         """Normalizing OS subprocess function calls between different platforms. This function is used for python 3.6
         and higher versions."""
+        # A raw os.posix_spawn would shave a fraction of a millisecond off each launch, but it
+        # would also drop the timeout enforcement that subprocess.run provides and that the run
+        # tasks rely on. Recent CPython already launches through vfork/posix_spawn internally
+        # where it is safe, so subprocess.run is kept.
         result = subprocess.run(command, timeout=timeout)
         return result.returncode
 
@@ -83,6 +87,11 @@ class Simulator(ABC):
     spice_exe = []
     process_name = ""
     raw_extension = '.raw'
+    # Subclasses wrapping a simulator that can stay resident and accept netlists over a pipe
+    # (e.g. ngspice in server mode) may set this to True and expose their own dispatch method,
+    # letting runners keep warm processes instead of paying the executable start-up per run.
+    # All bundled simulators launch one batch process per run, so this stays False here.
+    supports_server_mode = False
 
     @classmethod
     def create_from(cls, path_to_exe, process_name=None):
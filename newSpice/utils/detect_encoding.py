@@ -24,6 +24,9 @@ International Support functions
 Not using other known unicode detection libraries because we don't need something so complicated. LTSpice only supports
 for the time being a reduced set of encodings.
 """
+import codecs
+import functools
+import os
 from pathlib import Path
 from typing import Union
 
@@ -47,24 +50,77 @@ def detect_encoding(file_path: Union[str, Path], expected_str: str = '') -> str:
     :return: detected encoding
     :rtype: str
     """
+    # Log and raw readers call this repeatedly on the same files during a sweep, so results are
+    # cached per (path, mtime, size); a touched file misses the cache and is simply re-detected.
+    st = os.stat(file_path)
+    return _detect_cached(str(file_path), st.st_mtime_ns, st.st_size, expected_str)
+
+
+@functools.lru_cache(maxsize=4096)
+def _detect_cached(file_path: str, mtime_ns: int, size: int, expected_str: str) -> str:
+    """Does the detection work of :func:`detect_encoding`. mtime_ns and size only take part in the
+    cache key."""
+    # The file is read once, as raw bytes; the candidate encodings are then tried on the in-memory
+    # buffer. The previous version reopened and re-read the file for every candidate.
+    with open(file_path, 'rb') as f:
+        raw = f.read()
+    # A byte-order mark, or the ASCII-then-null signature of BOM-less UTF-16LE that LTSpice logs
+    # carry, settles the encoding from the first bytes without any trial decode. The codecs
+    # returned for marked files ('utf-16', 'utf-8-sig') strip the mark on read, so neither the
+    # expected_str check below nor a caller reopening the file with this encoding sees it as a
+    # stray first character.
+    if raw[:2] in (b'\xff\xfe', b'\xfe\xff'):
+        sniffed = 'utf-16'
+    elif raw[:3] == b'\xef\xbb\xbf':
+        sniffed = 'utf-8-sig'
+    elif len(raw) >= 2 and raw[0] != 0 and raw[1] == 0:
+        sniffed = 'utf_16_le'
+    else:
+        sniffed = None
+    if sniffed is not None:
+        try:
+            text = raw.decode(sniffed)
+        except UnicodeDecodeError:
+            pass  # Signature without a matching payload: let the trial loop have a go
+        else:
+            if text and (not expected_str or text.startswith(expected_str)):
+                return sniffed
+    # Fast path: the vast majority of SPICE netlists and libraries are plain ASCII. A scan of the
+    # raw bytes settles those immediately, instead of decoding the whole file once per candidate
+    # encoding below. Files containing NUL bytes (UTF-16) or any non-ASCII byte take the slow path.
+    try:
+        expected_bytes = expected_str.encode('ascii')
+    except UnicodeEncodeError:
+        expected_bytes = None
+    if expected_bytes is not None:
+        if raw and raw.isascii() and b'\x00' not in raw and raw.startswith(expected_bytes):
+            return 'utf-8'
+    head = raw[:4096]
     for encoding in ('utf-8', 'utf_16_le', 'cp1252', 'cp1250', 'shift_jis'):
+        # Candidates are screened on the first 4 KiB with an incremental decoder, so a wrong
+        # encoding is rejected at header cost instead of a decode of the whole buffer;
+        # final=False lets a multi-byte sequence cut at the 4 KiB boundary pass. Only a
+        # candidate surviving the header checks pays the full decode, which stays in place
+        # because the caller will read the entire file with the returned encoding.
         try:
-            with open(file_path, 'r', encoding=encoding) as f:
-                lines = f.readlines()
-                f.seek(0)
+            text = codecs.getincrementaldecoder(encoding)().decode(head, final=False)
         except UnicodeDecodeError:
             # This encoding didn't work, let's try again
             continue
         else:
-            if len(lines) == 0:
+            if len(text) == 0:
                 # Empty file
                 continue
             if expected_str:
-                if not lines[0].startswith(expected_str):
+                if not text.startswith(expected_str):
                     # File did not start with expected string
                     # Try again with a different encoding (This is unlikely to resolve the issue)
                     continue
-            if encoding == 'utf-8' and lines[0][1] == '\x00':
+            if encoding == 'utf-8' and len(text) > 1 and text[1] == '\x00':
+                continue
+            try:
+                raw.decode(encoding)
+            except UnicodeDecodeError:
                 continue
             return encoding
     else:
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+# -------------------------------------------------------------------------------
+#
+#  ███████╗██████╗ ██╗ ██████╗███████╗██╗     ██╗██████╗
+#  ██╔════╝██╔══██╗██║██╔════╝██╔════╝██║     ██║██╔══██╗
+#  ███████╗██████╔╝██║██║     █████╗  ██║     ██║██████╔╝
+#  ╚════██║██╔═══╝ ██║██║     ██╔══╝  ██║     ██║██╔══██╗
+#  ███████║██║     ██║╚██████╗███████╗███████╗██║██████╔╝
+#  ╚══════╝╚═╝     ╚═╝ ╚═════╝╚══════╝╚══════╝╚═╝╚═════╝
+#
+# Name:        test_spice_editor_regex.py
+# Purpose:     Regression on the match semantics of the component REPLACE_REGXES
+#
+# Author:      Nuno Brum (nuno.brum@gmail.com)
+#
+# Licence:     refer to the LICENSE file
+# -------------------------------------------------------------------------------
+
+import os
+import sys
+import unittest
+
+sys.path.append(
+    os.path.abspath((os.path.dirname(os.path.abspath(__file__)) + "/../")))  # add project root to lib search path
+
+from newSpice.editor.spice_editor import component_replace_regexs
+
+
+class SpiceEditorRegexTest(unittest.TestCase):
+    """These lines exercise the patterns that were rewritten for performance. Any change on the
+    captured groups would silently break set_component_value() and friends."""
+
+    def check(self, line, designator, value, params=None):
+        match = component_replace_regexs[line[0]].match(line)
+        self.assertIsNotNone(match, f"Line '{line}' did not match")
+        self.assertEqual(match.group('designator'), designator)
+        self.assertEqual(match.group('value'), value)
+        if params is not None:
+            self.assertEqual(match.group('params'), params)
+
+    def test_subcircuit_regex(self):
+        self.check("XU1 in out vcc vss OPAMP", 'XU1', 'OPAMP', '')
+        self.check("X1 n1 n2 MYSUB params: A=1 B={freq*2}", 'X1', 'MYSUB', ' A=1 B={freq*2}')
+        self.check("X2 n1 n2 MYSUB A=1 B=2k", 'X2', 'MYSUB', ' A=1 B=2k')
+        self.check("X§U2 a b c SUB3", 'X§U2', 'SUB3', '')
+        # a wide instance must still resolve the last token as the sub-circuit name
+        nodes = ' '.join(f"n{i}" for i in range(40))
+        self.check(f"XWIDE {nodes} BIGSUB", 'XWIDE', 'BIGSUB', '')
+
+    def test_resistor_regex(self):
+        self.check("R1 n1 n2 1k", 'R1', '1k')
+        self.check("R2 n1 n2 {rload}", 'R2', '{rload}')
+        self.check("R3 n1 n2 2Meg", 'R3', '2Meg')
+        self.check("R4 n1 n2 R=1k", 'R4', 'R=1k')
+
+    def test_capacitor_regex(self):
+        self.check("C1 n1 n2 10n", 'C1', '10n')
+        self.check("C2 n1 n2 {cap}", 'C2', '{cap}')
+        self.check("C3 n1 n2 2.2uF", 'C3', '2.2uF')
+
+    def test_no_match(self):
+        self.assertIsNone(component_replace_regexs['X'].match("X1"))
+        self.assertIsNone(component_replace_regexs['R'].match("R1 n1"))
+
+
+if __name__ == '__main__':
+    unittest.main()